@@ -7,142 +7,226 @@ from September 2022 to February 2025.
 import matplotlib.pyplot as plt
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
 import matplotlib.dates as mdates
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
+import functools
+import glob
+import hashlib
+import os
 
-def generate_synthetic_trends_data():
+# Weekly sampling from September 2022 to February 2025. The first date is the
+# first Sunday of the period, matching pandas' 'W' (W-SUN) anchor; the end is
+# exclusive.
+_D_FIRST_WEEK = np.datetime64('2022-09-04')
+_D_END = np.datetime64('2025-03-01')
+_WEEK = np.timedelta64(7, 'D')
+
+# Regime boundaries shared by the tool trends below
+_D_NOV22 = np.datetime64('2022-11-01')
+_D_DEC22 = np.datetime64('2022-12-01')
+_D_JAN23 = np.datetime64('2023-01-01')
+_D_MAR23 = np.datetime64('2023-03-01')
+_D_JUN23 = np.datetime64('2023-06-01')
+_D_JUL23 = np.datetime64('2023-07-01')
+_D_AUG23 = np.datetime64('2023-08-01')
+_D_DEC23 = np.datetime64('2023-12-01')
+_D_JAN24 = np.datetime64('2024-01-01')
+_D_MAR24 = np.datetime64('2024-03-01')
+_D_JUN24 = np.datetime64('2024-06-01')
+_D_OCT24 = np.datetime64('2024-10-01')
+_BOUNDARIES = (
+    _D_NOV22, _D_DEC22, _D_JAN23, _D_MAR23, _D_JUN23, _D_JUL23,
+    _D_AUG23, _D_DEC23, _D_JAN24, _D_MAR24, _D_JUN24, _D_OCT24,
+)
+
+# Release/rebrand dates that the growth ramps are measured from
+_ANCHORS = (_D_NOV22, _D_JAN23, _D_MAR23, _D_DEC23, _D_JAN24, _D_OCT24)
+
+# Each trend is piecewise over date regimes. The dates are sorted, so every
+# regime is a contiguous slice between two boundary positions and each helper
+# fills its output column slice by slice, in place, with no mask temporaries.
+# The unit noise for every tool comes from one batched draw and is scaled per
+# regime.
+
+def _slices(cut, *boundaries):
+    """Split the date axis at the given boundaries into consecutive slices."""
+    stops = [cut[boundary] for boundary in boundaries]
+    return [slice(lo, hi) for lo, hi in zip([0] + stops, stops + [None])]
+
+def _chatgpt(cut, days, noise, out):
+    """ChatGPT: Released November 2022, explosive growth, then stabilization"""
+    before, launch, peak, decline, stable = _slices(cut, _D_NOV22, _D_DEC22, _D_MAR23, _D_AUG23)
+    # Before release
+    out[before] = 2 + 1 * noise[before]
+    # Initial release period - rapid growth
+    weeks_since_release = days[_D_NOV22][launch] / 7
+    out[launch] = np.minimum(85, 5 + weeks_since_release * 20) + 5 * noise[launch]
+    # Peak popularity period
+    out[peak] = 95 + 8 * noise[peak]
+    # High but declining
+    months_since_peak = days[_D_MAR23][decline] / 30
+    out[decline] = np.maximum(60, 95 - months_since_peak * 8) + 6 * noise[decline]
+    # Stabilized high usage
+    out[stable] = 75 + 10 * noise[stable]
+    np.clip(out, 0, 100, out=out)
+
+def _claude(cut, days, noise, out):
+    """Claude: Gradual growth, steady increase"""
+    early, growing, steady, mature = _slices(cut, _D_JAN23, _D_JUN23, _D_JAN24)
+    # Early period, low awareness
+    out[early] = 5 + 2 * noise[early]
+    # Growing awareness
+    months_since_start = days[_D_JAN23][growing] / 30
+    out[growing] = 5 + months_since_start * 8 + 3 * noise[growing]
+    # Steady growth
+    out[steady] = 40 + 8 * noise[steady]
+    # Mature adoption
+    out[mature] = 55 + 10 * noise[mature]
+    np.clip(out, 0, 100, out=out)
+
+def _gemini(cut, days, noise, out):
+    """Gemini: Released as Bard in March 2023, rebranded to Gemini in December 2023"""
+    before, bard_launch, bard, rebrand, mature = _slices(cut, _D_MAR23, _D_JUN23, _D_DEC23, _D_MAR24)
+    # Before Bard release
+    out[before] = 1 + 0.5 * noise[before]
+    # Bard initial release
+    months_since_release = days[_D_MAR23][bard_launch] / 30
+    out[bard_launch] = 15 + months_since_release * 12 + 4 * noise[bard_launch]
+    # Bard period - moderate growth
+    out[bard] = 45 + 8 * noise[bard]
+    # Gemini rebrand boost
+    months_since_rebrand = days[_D_DEC23][rebrand] / 30
+    out[rebrand] = 45 + months_since_rebrand * 10 + 6 * noise[rebrand]
+    # Gemini mature period
+    out[mature] = 65 + 12 * noise[mature]
+    np.clip(out, 0, 100, out=out)
+
+def _copilot(cut, days, noise, out):
+    """Copilot: Steady growth, professional tool adoption pattern"""
+    early, growing, steady, mainstream = _slices(cut, _D_JAN23, _D_JUL23, _D_JUN24)
+    # Early developer awareness
+    out[early] = 15 + 4 * noise[early]
+    # Growing professional adoption
+    months_since_start = days[_D_JAN23][growing] / 30
+    out[growing] = 15 + months_since_start * 5 + 3 * noise[growing]
+    # Steady professional use
+    out[steady] = 35 + 6 * noise[steady]
+    # Increased mainstream awareness
+    out[mainstream] = 45 + 8 * noise[mainstream]
+    np.clip(out, 0, 100, out=out)
+
+def _deepseek(cut, days, noise, out):
+    """Deepseek: More recent entrant, rapid growth in 2024"""
+    before, initial, accelerating, surge = _slices(cut, _D_JAN24, _D_JUN24, _D_OCT24)
+    # Very low awareness before 2024
+    out[before] = 2 + 1 * noise[before]
+    # Initial growth
+    months_since_start = days[_D_JAN24][initial] / 30
+    out[initial] = 2 + months_since_start * 6 + 2 * noise[initial]
+    # Accelerating growth
+    out[accelerating] = 30 + 6 * noise[accelerating]
+    # Recent surge in popularity
+    months_since_surge = days[_D_OCT24][surge] / 30
+    out[surge] = 30 + months_since_surge * 15 + 8 * noise[surge]
+    np.clip(out, 0, 100, out=out)
+
+# Column order of the generated data
+_TRENDS = (
+    ('ChatGPT', _chatgpt),
+    ('Claude', _claude),
+    ('Gemini', _gemini),
+    ('Copilot', _copilot),
+    ('Deepseek', _deepseek),
+)
+
+def generate_synthetic_trends_data(seed=None):
     """
     Generate synthetic but representative Google Trends data for AI tools in Spain.
     Values are on a 0-100 scale where 100 represents peak popularity.
+    Pass a seed to make the generated noise reproducible.
+    """
+    
+    # Weekly data points from September 2022 to February 2025, as a plain
+    # datetime64[D] array; pandas only wraps it for the returned DataFrame
+    dt = np.arange(_D_FIRST_WEEK, _D_END, _WEEK)
+    rng = np.random.default_rng(seed)
+    
+    # Locate every regime boundary in the sorted dates once and share the
+    # positions across all tools
+    cut = dict(zip(_BOUNDARIES, np.searchsorted(dt, _BOUNDARIES)))
+    # Whole days elapsed since each anchor, as one vectorized subtraction each
+    days = {anchor: (dt - anchor).astype(np.int32) for anchor in _ANCHORS}
+    
+    # Fill a column-major block in place, one contiguous column per tool, and
+    # wrap it in a single DataFrame instead of assembling it column by column
+    # from a dict. float32 is ample for a 0-100 index and is what matplotlib
+    # rasterizes with anyway.
+    trends = np.empty((len(dt), len(_TRENDS)), dtype=np.float32, order='F')
+    noise = rng.standard_normal((len(_TRENDS), len(dt)), dtype=np.float32)
+    for j, (_, trend) in enumerate(_TRENDS):
+        trend(cut, days, noise[j], trends[:, j])
+    
+    df = pd.DataFrame(trends, columns=[tool for tool, _ in _TRENDS])
+    df.insert(0, 'Date', pd.DatetimeIndex(dt))
+    return df
+
+# Parquet cache of the generated data, keyed by seed and by a digest of this
+# module's source, so editing the generator stops old caches being served
+TRENDS_CACHE = 'google_trends_seed{seed}_{version}.parquet'
+
+@functools.lru_cache(maxsize=1)
+def _source_digest():
+    """Short digest of this module's source, read once per process."""
+    with open(__file__, 'rb') as f:
+        return hashlib.blake2b(f.read(), digest_size=4).hexdigest()
+
+def trends_cache_path(seed=42):
+    """Return the Parquet cache path for the given seed and the current generator."""
+    return TRENDS_CACHE.format(seed=seed, version=_source_digest())
+
+def get_trends_df(seed=42, cache=None):
+    """
+    Return the synthetic trends data for the given seed, reading it from a
+    Parquet cache when one exists and generating (then caching) it otherwise.
+    With seed=None the data is unseeded, so it is always generated afresh and
+    never cached. Writing a new default cache removes the ones it supersedes.
     """
+    if seed is None:
+        return generate_synthetic_trends_data()
     
-    # Create date range from September 2022 to February 2025
-    start_date = datetime(2022, 9, 1)
-    end_date = datetime(2025, 2, 28)
-    dates = pd.date_range(start=start_date, end=end_date, freq='W')  # Weekly data points
-    
-    # Initialize the data dictionary
-    data = {'Date': dates}
-    
-    # ChatGPT: Released November 2022, explosive growth, then stabilization
-    chatgpt_trend = []
-    for date in dates:
-        if date < datetime(2022, 11, 1):
-            # Before release
-            value = np.random.normal(2, 1)
-        elif date < datetime(2022, 12, 1):
-            # Initial release period - rapid growth
-            weeks_since_release = (date - datetime(2022, 11, 1)).days / 7
-            value = min(85, 5 + weeks_since_release * 20) + np.random.normal(0, 5)
-        elif date < datetime(2023, 3, 1):
-            # Peak popularity period
-            value = np.random.normal(95, 8)
-        elif date < datetime(2023, 8, 1):
-            # High but declining
-            months_since_peak = (date - datetime(2023, 3, 1)).days / 30
-            value = max(60, 95 - months_since_peak * 8) + np.random.normal(0, 6)
-        else:
-            # Stabilized high usage
-            value = np.random.normal(75, 10)
-        
-        chatgpt_trend.append(max(0, min(100, value)))
-    
-    data['ChatGPT'] = chatgpt_trend
-    
-    # Claude: Gradual growth, steady increase
-    claude_trend = []
-    for date in dates:
-        if date < datetime(2023, 1, 1):
-            # Early period, low awareness
-            value = np.random.normal(5, 2)
-        elif date < datetime(2023, 6, 1):
-            # Growing awareness
-            months_since_start = (date - datetime(2023, 1, 1)).days / 30
-            value = 5 + months_since_start * 8 + np.random.normal(0, 3)
-        elif date < datetime(2024, 1, 1):
-            # Steady growth
-            value = np.random.normal(40, 8)
-        else:
-            # Mature adoption
-            value = np.random.normal(55, 10)
-        
-        claude_trend.append(max(0, min(100, value)))
-    
-    data['Claude'] = claude_trend
-    
-    # Gemini: Released as Bard in March 2023, rebranded to Gemini in December 2023
-    gemini_trend = []
-    for date in dates:
-        if date < datetime(2023, 3, 1):
-            # Before Bard release
-            value = np.random.normal(1, 0.5)
-        elif date < datetime(2023, 6, 1):
-            # Bard initial release
-            months_since_release = (date - datetime(2023, 3, 1)).days / 30
-            value = 15 + months_since_release * 12 + np.random.normal(0, 4)
-        elif date < datetime(2023, 12, 1):
-            # Bard period - moderate growth
-            value = np.random.normal(45, 8)
-        elif date < datetime(2024, 3, 1):
-            # Gemini rebrand boost
-            months_since_rebrand = (date - datetime(2023, 12, 1)).days / 30
-            value = 45 + months_since_rebrand * 10 + np.random.normal(0, 6)
-        else:
-            # Gemini mature period
-            value = np.random.normal(65, 12)
-        
-        gemini_trend.append(max(0, min(100, value)))
-    
-    data['Gemini'] = gemini_trend
-    
-    # Copilot: Steady growth, professional tool adoption pattern
-    copilot_trend = []
-    for date in dates:
-        if date < datetime(2023, 1, 1):
-            # Early developer awareness
-            value = np.random.normal(15, 4)
-        elif date < datetime(2023, 7, 1):
-            # Growing professional adoption
-            months_since_start = (date - datetime(2023, 1, 1)).days / 30
-            value = 15 + months_since_start * 5 + np.random.normal(0, 3)
-        elif date < datetime(2024, 6, 1):
-            # Steady professional use
-            value = np.random.normal(35, 6)
-        else:
-            # Increased mainstream awareness
-            value = np.random.normal(45, 8)
-        
-        copilot_trend.append(max(0, min(100, value)))
-    
-    data['Copilot'] = copilot_trend
-    
-    # Deepseek: More recent entrant, rapid growth in 2024
-    deepseek_trend = []
-    for date in dates:
-        if date < datetime(2024, 1, 1):
-            # Very low awareness before 2024
-            value = np.random.normal(2, 1)
-        elif date < datetime(2024, 6, 1):
-            # Initial growth
-            months_since_start = (date - datetime(2024, 1, 1)).days / 30
-            value = 2 + months_since_start * 6 + np.random.normal(0, 2)
-        elif date < datetime(2024, 10, 1):
-            # Accelerating growth
-            value = np.random.normal(30, 6)
-        else:
-            # Recent surge in popularity
-            months_since_surge = (date - datetime(2024, 10, 1)).days / 30
-            value = 30 + months_since_surge * 15 + np.random.normal(0, 8)
-        
-        deepseek_trend.append(max(0, min(100, value)))
-    
-    data['Deepseek'] = deepseek_trend
-    
-    return pd.DataFrame(data)
-
-def create_trends_chart(df, save_path='google_trends_spain_2022_2025.png'):
+    default_cache = cache is None
+    if default_cache:
+        cache = trends_cache_path(seed)
+    
+    if os.path.exists(cache):
+        return pd.read_parquet(cache)
+    
+    df = generate_synthetic_trends_data(seed)
+    if default_cache:
+        for stale in glob.glob(TRENDS_CACHE.format(seed=seed, version='*')):
+            os.remove(stale)
+    df.to_parquet(cache, compression='zstd', index=False)
+    return df
+
+def _downsample(x, y, n_out):
+    """
+    Reduce (x, y) to n_out visually representative points with LTTB
+    (Largest-Triangle-Three-Buckets). Shorter series are returned unchanged.
+    """
+    if n_out is None or len(x) <= n_out:
+        return x, y
+    
+    from tsdownsample import LTTBDownsampler
+    idx = LTTBDownsampler().downsample(x, y, n_out=n_out)
+    return x[idx], y[idx]
+
+def create_trends_chart(df, save_path='google_trends_spain_2022_2025.png', target_points=2000):
     """
     Create and save a line chart showing Google Trends data for AI tools in Spain.
+    Series longer than target_points are downsampled with LTTB before plotting;
+    pass target_points=None to always plot every point.
+    The figure is closed once shown; the saved file's path is returned.
     """
     
     plt.style.use('default')
@@ -157,13 +241,17 @@ def create_trends_chart(df, save_path='google_trends_spain_2022_2025.png'):
         'Deepseek': '#FECA57'    # Yellow
     }
     
-    # Plot each tool's trend
-    for tool in ['ChatGPT', 'Claude', 'Gemini', 'Copilot', 'Deepseek']:
-        ax.plot(df['Date'], df[tool], 
-               label=tool, 
-               color=colors[tool], 
-               linewidth=2.5, 
-               alpha=0.8)
+    # Plot every tool's trend as one LineCollection so the lines are drawn
+    # and autoscaled in a single pass
+    tools = ['ChatGPT', 'Claude', 'Gemini', 'Copilot', 'Deepseek']
+    x = mdates.date2num(df['Date'])
+    segments = [np.column_stack(_downsample(x, df[tool].values, target_points)) for tool in tools]
+    ax.add_collection(LineCollection(segments,
+                                     colors=[colors[tool] for tool in tools],
+                                     linewidths=2.5,
+                                     alpha=0.8))
+    ax.xaxis_date()
+    ax.autoscale_view()
     
     # Customize the chart
     ax.set_title('Google Trends: AI Tools Popularity in Spain\n(September 2022 - February 2025)', 
@@ -174,13 +262,14 @@ def create_trends_chart(df, save_path='google_trends_spain_2022_2025.png'):
     # Format x-axis
     ax.xaxis.set_major_locator(mdates.MonthLocator(interval=3))
     ax.xaxis.set_major_formatter(mdates.DateFormatter('%b %Y'))
-    plt.xticks(rotation=45)
+    ax.tick_params(axis='x', labelrotation=45)
     
     # Add grid
     ax.grid(True, alpha=0.3, linestyle='-', linewidth=0.5)
     
-    # Customize legend
-    ax.legend(loc='upper left', frameon=True, shadow=True, fontsize=11)
+    # Customize legend (LineCollection carries no per-line labels, so use proxies)
+    handles = [Line2D([], [], color=colors[tool], linewidth=2.5, alpha=0.8) for tool in tools]
+    ax.legend(handles, tools, loc='upper left', frameon=True, shadow=True, fontsize=11)
     
     # Set y-axis limits
     ax.set_ylim(0, 105)
@@ -189,41 +278,49 @@ def create_trends_chart(df, save_path='google_trends_spain_2022_2025.png'):
     ax.set_facecolor('#FAFAFA')
     
     # Adjust layout
-    plt.tight_layout()
+    fig.tight_layout()
     
     # Add annotation
-    plt.figtext(0.02, 0.02, 'Data: Synthetic representative trends based on actual release dates and market adoption patterns', 
-                fontsize=8, style='italic', alpha=0.7)
+    fig.text(0.02, 0.02, 'Data: Synthetic representative trends based on actual release dates and market adoption patterns', 
+             fontsize=8, style='italic', alpha=0.7)
     
     # Save the chart
-    plt.savefig(save_path, dpi=300, bbox_inches='tight', facecolor='white')
+    fig.savefig(save_path, dpi=300, bbox_inches='tight', facecolor='white')
     print(f"Chart saved as: {save_path}")
     
-    # Show the chart
+    # Show the chart, then free its canvas
     plt.show()
+    plt.close(fig)
     
-    return fig
+    return save_path
 
 def main():
     """
     Main function to generate data and create the visualization.
     """
+    seed = 42
     print("Generating synthetic Google Trends data for AI tools in Spain...")
-    df = generate_synthetic_trends_data()
+    df = get_trends_df(seed)
     
     print("\nData generated successfully!")
     print(f"Date range: {df['Date'].min().strftime('%B %Y')} to {df['Date'].max().strftime('%B %Y')}")
     print(f"Total data points: {len(df)}")
     
     print("\nCreating visualization...")
-    fig = create_trends_chart(df)
+    create_trends_chart(df)
     
     print("\nSample data preview:")
     print(df.head(10).to_string(index=False))
     
-    # Save the data to CSV for reference
-    df.to_csv('google_trends_data.csv', index=False)
-    print("\nRaw data saved as: google_trends_data.csv")
+    # Save the data to CSV for reference, unless the CSV is already newer
+    # than the cached data it would be exported from
+    csv_path = 'google_trends_data.csv'
+    cache = trends_cache_path(seed)
+    if not os.path.exists(csv_path) or os.path.getmtime(csv_path) < os.path.getmtime(cache):
+        df.to_csv(csv_path, index=False, lineterminator='\n')
+        print(f"\nRaw data saved as: {csv_path}")
+    else:
+        print(f"\nRaw data already up to date: {csv_path}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file